@@ -1,12 +1,26 @@
 import streamlit as st
-import openai
-import requests
-from PIL import Image
 import io
-import base64
+try:
+    # SIMD-accelerated drop-in for decoding the ~2 MB b64_json image payloads
+    import pybase64 as base64
+except ImportError:
+    import base64
+import asyncio
+import json
+try:
+    # Faster parsing for raw API response bodies
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+import hashlib
+import tempfile
+import time
 from datetime import datetime
 import os
 
+# Heavy modules (openai, httpx, PIL) are imported where they are first needed,
+# so a cold start that only renders the page doesn't pay for them
+
 # Set page config
 st.set_page_config(
     page_title="Mandala Art Generator",
@@ -15,105 +29,292 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_data(show_spinner=False)
+def load_css():
+    """Read the custom stylesheet once; it is still emitted inline on every rerun"""
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "style.css")) as f:
+        return f.read()
+
 # Custom CSS for better styling
-st.markdown("""
-<style>
-    .main-header {
-        text-align: center;
-        color: #4A90E2;
-        font-size: 3rem;
-        margin-bottom: 0.5rem;
-    }
-    .sub-header {
-        text-align: center;
-        color: #666;
-        font-size: 1.2rem;
-        margin-bottom: 2rem;
-    }
-    .inspiration-box {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 20px;
-        border-radius: 10px;
-        margin: 20px 0;
-        color: white;
-    }
-    .download-btn {
-        background: #4CAF50;
-        color: white;
-        padding: 10px 20px;
-        border-radius: 5px;
-        text-decoration: none;
-        display: inline-block;
-        margin-top: 10px;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(f"<style>\n{load_css()}</style>", unsafe_allow_html=True)
+
+@st.cache_resource(show_spinner=False)
+def get_http_client():
+    """Shared HTTP/2 connection pool, kept alive across reruns and sessions"""
+    import httpx
+    return httpx.Client(http2=True)
+
+@st.cache_resource(show_spinner=False, max_entries=32, ttl=3600)
+def get_openai_client(api_key):
+    """Create an OpenAI client, reused across reruns for the same API key (bounded, expires after 1h)"""
+    import openai
+    return openai.OpenAI(api_key=api_key, http_client=get_http_client())
 
 def initialize_openai(api_key):
     """Initialize OpenAI client with API key"""
-    if api_key:
-        try:
-            client = openai.OpenAI(api_key=api_key)
-            return client
-        except Exception as e:
-            st.error(f"❌ Invalid API Key: {str(e)}")
-            return None
-    return None
+    if not api_key:
+        return None
+    try:
+        return get_openai_client(api_key)
+    except Exception as e:
+        st.error(f"❌ Invalid API Key: {str(e)}")
+        return None
 
-def create_mandala_prompt(user_inspiration, style_preference, color_scheme, num_axes):
-    """Create a detailed prompt for DALL-E 3 mandala generation"""
-    base_prompt = f"""Create a beautiful, intricate mandala art inspired by: {user_inspiration}. 
+# Prompt template for DALL-E 3 mandala generation; formatted per request
+MANDALA_PROMPT_TEMPLATE = """Create a beautiful, intricate mandala art inspired by: {inspiration}. 
     
     The mandala should be:
-    - Perfectly symmetrical and circular with {num_axes}-fold rotational symmetry
-    - {num_axes} identical sections radiating from the center
-    - Highly detailed with intricate patterns repeating every {360//num_axes} degrees
-    - {style_preference} style
-    - Using {color_scheme} color palette
+    - Perfectly symmetrical and circular with {axes}-fold rotational symmetry
+    - {axes} identical sections radiating from the center
+    - Highly detailed with intricate patterns repeating every {degrees} degrees
+    - {style} style
+    - Using {colors} color palette
     - Centered on a clean background
-    - Sacred geometry elements with {num_axes}-way symmetry
+    - Sacred geometry elements with {axes}-way symmetry
     - Meditative and harmonious design
     - Professional digital art quality
     
-    Style: Detailed mandala artwork, spiritual, geometric, ornate patterns, {num_axes}-fold symmetry"""
-    
-    return base_prompt
+    Style: Detailed mandala artwork, spiritual, geometric, ornate patterns, {axes}-fold symmetry"""
+
+def create_mandala_prompt(user_inspiration, style_preference, color_scheme, num_axes):
+    """Create a detailed prompt for DALL-E 3 mandala generation"""
+    return MANDALA_PROMPT_TEMPLATE.format(
+        inspiration=user_inspiration,
+        style=style_preference,
+        colors=color_scheme,
+        axes=num_axes,
+        degrees=360 // num_axes
+    )
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def make_preview(image_bytes, max_size=768):
+    """Downscale a generated PNG for on-page display; downloads keep the original"""
+    from PIL import Image
+    with io.BytesIO(image_bytes) as buf:
+        image = Image.open(buf)
+        image.load()
+    image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+    with io.BytesIO() as out:
+        image.save(out, format="PNG")
+        return out.getvalue()
+
+# Generated mandalas are kept on disk, keyed by their inputs, so repeats cost no API call
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".mandala_cache")
+CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+CACHE_MAX_FILES = 200
+
+def mandala_cache_key(api_key, prompt, quality, variant=0):
+    """Hash the generation inputs into a cache key, scoped to the API key that paid for them"""
+    return hashlib.sha256(f"{api_key}|{prompt}|{quality}|{variant}".encode()).hexdigest()
+
+def load_cached_mandala(key):
+    """Return cached PNG bytes for a key, or None on a miss or an expired entry"""
+    path = os.path.join(CACHE_DIR, f"{key}.png")
+    try:
+        if time.time() - os.path.getmtime(path) > CACHE_MAX_AGE:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+def prune_mandala_cache():
+    """Drop expired entries, then the oldest ones beyond CACHE_MAX_FILES"""
+    try:
+        entries = []
+        for name in os.listdir(CACHE_DIR):
+            if name.endswith(".png"):
+                path = os.path.join(CACHE_DIR, name)
+                entries.append((os.path.getmtime(path), path))
+        entries.sort(reverse=True)
+        now = time.time()
+        for i, (mtime, path) in enumerate(entries):
+            if i >= CACHE_MAX_FILES or now - mtime > CACHE_MAX_AGE:
+                os.remove(path)
+    except OSError:
+        # Another session may have pruned the same file first
+        pass
+
+def store_cached_mandala(key, image_bytes):
+    """Best-effort write of PNG bytes to the cache, replacing atomically so readers never see a partial file"""
+    tmp_path = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        path = os.path.join(CACHE_DIR, f"{key}.png")
+        # Sessions are threads in one process, so each writer needs its own temp file
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix=".tmp", delete=False) as f:
+            tmp_path = f.name
+            f.write(image_bytes)
+        os.replace(tmp_path, path)
+        prune_mandala_cache()
+    except OSError:
+        # A read-only or full disk must never cost an already generated image
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def decode_image_response(raw_response):
+    """Pull the PNG out of a raw images response without building pydantic models"""
+    return base64.b64decode(json_loads(raw_response.http_response.content)["data"][0]["b64_json"])
 
-def generate_mandala(client, prompt):
-    """Generate mandala using DALL-E 3"""
+def generate_mandala(client, prompt, quality="standard", reuse_cached=True):
+    """Generate mandala using DALL-E 3, optionally reusing a cached result for identical inputs"""
+    key = mandala_cache_key(client.api_key, prompt, quality)
+    cached = load_cached_mandala(key) if reuse_cached else None
+    if cached:
+        return cached
+    
     try:
-        response = client.images.generate(
+        response = client.images.with_raw_response.generate(
             model="dall-e-3",
             prompt=prompt,
             size="1024x1024",
-            quality="hd",
+            quality=quality,
             n=1,
+            response_format="b64_json",
         )
         
-        image_url = response.data[0].url
-        return image_url
+        # The PNG comes back inline, so no second request to fetch it
+        image_bytes = decode_image_response(response)
     except Exception as e:
         st.error(f"Error generating image: {str(e)}")
         return None
+    
+    store_cached_mandala(key, image_bytes)
+    return image_bytes
 
-def download_image(image_url):
-    """Download image from URL and return as bytes"""
-    try:
-        response = requests.get(image_url)
-        if response.status_code == 200:
-            return response.content
+async def generate_mandala_async(client, prompt, quality="standard"):
+    """Generate a single mandala using DALL-E 3 with the async client"""
+    response = await client.images.with_raw_response.generate(
+        model="dall-e-3",
+        prompt=prompt,
+        size="1024x1024",
+        quality=quality,
+        n=1,
+        response_format="b64_json",
+    )
+    return decode_image_response(response)
+
+async def gather_mandala_variants(api_key, prompt, num_variants, quality="standard", on_complete=None, reuse_cached=True):
+    """Fire all variant requests concurrently over one HTTP/2 connection, reporting each as it finishes"""
+    import httpx
+    import openai
+    
+    async def run_variant(index):
+        # Variant 0 shares its cache entry with a single-image generation
+        key = mandala_cache_key(api_key, prompt, quality, index)
+        cached = load_cached_mandala(key) if reuse_cached else None
+        if cached:
+            return index, cached
+        try:
+            image_bytes = await generate_mandala_async(client, prompt, quality)
+        except Exception as e:
+            return index, e
+        store_cached_mandala(key, image_bytes)
+        return index, image_bytes
+    
+    results = [None] * num_variants
+    async with openai.AsyncOpenAI(api_key=api_key, http_client=httpx.AsyncClient(http2=True)) as client:
+        tasks = [run_variant(i) for i in range(num_variants)]
+        for done, next_result in enumerate(asyncio.as_completed(tasks), start=1):
+            index, result = await next_result
+            results[index] = result
+            if on_complete:
+                on_complete(index, result, done)
+    return results
+
+def generate_mandala_variants(api_key, prompt, num_variants, quality="standard", reuse_cached=True):
+    """Generate several mandala variants concurrently, returning the successful images and error messages"""
+    # Progress bar plus one placeholder per variant, filled in as each request resolves
+    progress = st.progress(0.0, text=f"Generated 0 of {num_variants} variants")
+    preview_cols = st.columns(2)
+    placeholders = [preview_cols[i % 2].empty() for i in range(num_variants)]
+    
+    def on_complete(index, result, done):
+        progress.progress(done / num_variants, text=f"Generated {done} of {num_variants} variants")
+        if isinstance(result, Exception):
+            placeholders[index].error(f"Error generating image: {str(result)}")
         else:
-            st.error("Failed to download image")
-            return None
+            placeholders[index].image(make_preview(result), caption=f"Variant {index + 1}", use_container_width=True)
+    
+    try:
+        results = asyncio.run(gather_mandala_variants(api_key, prompt, num_variants, quality, on_complete, reuse_cached))
+    except Exception as e:
+        st.error(f"Error generating images: {str(e)}")
+        return [], []
+    
+    images = [result for result in results if not isinstance(result, Exception)]
+    errors = [
+        f"Variant {index + 1}: {str(result)}"
+        for index, result in enumerate(results)
+        if isinstance(result, Exception)
+    ]
+    return images, errors
+
+def build_batch_file(inspirations, style_preference, color_scheme, num_axes, quality="standard"):
+    """Build the JSONL input file for an OpenAI Batch API image job"""
+    lines = []
+    for i, inspiration in enumerate(inspirations):
+        lines.append(json.dumps({
+            "custom_id": f"mandala-{i}",
+            "method": "POST",
+            "url": "/v1/images/generations",
+            "body": {
+                "model": "dall-e-3",
+                "prompt": create_mandala_prompt(inspiration, style_preference, color_scheme, num_axes),
+                "size": "1024x1024",
+                "quality": quality,
+                "n": 1,
+                "response_format": "b64_json",
+            },
+        }))
+    return "\n".join(lines).encode()
+
+def submit_batch(client, inspirations, style_preference, color_scheme, num_axes, quality="standard"):
+    """Upload the batch input file and start a Batch API job"""
+    try:
+        batch_file = client.files.create(
+            file=("mandala_batch.jsonl", build_batch_file(inspirations, style_preference, color_scheme, num_axes, quality)),
+            purpose="batch"
+        )
+        return client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/images/generations",
+            completion_window="24h"
+        )
     except Exception as e:
-        st.error(f"Error downloading image: {str(e)}")
+        st.error(f"Error submitting batch: {str(e)}")
         return None
 
-def create_download_link(image_bytes, filename):
-    """Create a download link for the image"""
-    b64 = base64.b64encode(image_bytes).decode()
-    href = f'<a href="data:image/png;base64,{b64}" download="{filename}" class="download-btn">📥 Download Mandala</a>'
-    return href
+def describe_batch_error(record):
+    """Extract a readable error message from a failed Batch API output line"""
+    error = record.get("error") or {}
+    if not error:
+        body = (record.get("response") or {}).get("body") or {}
+        error = body.get("error") or {}
+    return error.get("message") or error.get("code") or "Unknown error"
+
+def fetch_batch_results(client, batch_id):
+    """Return the batch job, its images keyed by custom_id, and failed items keyed by custom_id"""
+    batch = client.batches.retrieve(batch_id)
+    results = {}
+    failures = {}
+    
+    # Expired or cancelled batches can still carry partial output
+    if batch.status in ("completed", "expired", "cancelled"):
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            output = client.files.content(file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = json_loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[record["custom_id"]] = base64.b64decode(response["body"]["data"][0]["b64_json"])
+                else:
+                    failures[record["custom_id"]] = describe_batch_error(record)
+    return batch, results, failures
 
 def main():
     # Header
@@ -126,19 +327,6 @@ def main():
     # Sidebar for settings
     st.sidebar.title("🎨 Mandala Settings")
     
-    # Number of axes for symmetry
-    num_axes = st.sidebar.slider(
-        "Number of Symmetry Axes:",
-        min_value=3,
-        max_value=12,
-        value=8,
-        step=1,
-        help="Controls the rotational symmetry of the mandala (e.g., 4 = 4-fold symmetry, 8 = 8-fold symmetry)"
-    )
-    
-    # Display symmetry info
-    st.sidebar.info(f"🔄 Your mandala will have {num_axes}-fold rotational symmetry with {num_axes} identical sections")
-    
     # Style preferences
     style_options = [
         "Traditional Buddhist",
@@ -162,9 +350,35 @@ def main():
         "Jewel tones"
     ]
     
+    # Number of axes for symmetry
+    num_axes = st.sidebar.slider(
+        "Number of Symmetry Axes:",
+        min_value=3,
+        max_value=12,
+        value=8,
+        step=1,
+        help="Controls the rotational symmetry of the mandala (e.g., 4 = 4-fold symmetry, 8 = 8-fold symmetry)"
+    )
+    
+    # Number of variants, generated concurrently
+    num_variants = st.sidebar.slider(
+        "Number of Variants:",
+        min_value=1,
+        max_value=4,
+        value=1,
+        step=1,
+        help="Generate several mandalas from the same settings at once (each variant is a separate DALL-E request)"
+    )
+    
     style_preference = st.sidebar.selectbox("Choose Style:", style_options)
     color_scheme = st.sidebar.selectbox("Choose Color Scheme:", color_options)
     
+    # Standard quality is faster and cheaper; HD is opt-in
+    quality = "hd" if st.sidebar.checkbox("HD quality (slower, 2× cost)") else "standard"
+    
+    # Display symmetry info
+    st.sidebar.info(f"🔄 Your mandala will have {num_axes}-fold rotational symmetry with {num_axes} identical sections")
+    
     # Main content area
     col1, col2 = st.columns([1, 1])
     
@@ -180,35 +394,45 @@ def main():
             help="Get your API key from https://platform.openai.com/"
         )
         
-        # User input
-        user_inspiration = st.text_area(
-            "What inspires your mandala? (e.g., nature, emotions, experiences, dreams)",
-            placeholder="Enter your inspiration here... (e.g., 'sunset over mountains', 'feeling of peace and harmony', 'blooming lotus flower')",
-            height=100
-        )
-        
-        # Example inspirations
-        st.markdown("#### 💡 Need inspiration? Try these:")
-        example_inspirations = [
-            "Ocean waves and seashells",
-            "Mountain peaks and pine trees",
-            "Butterfly wings and flowers",
-            "Stars and cosmic energy",
-            "Ancient wisdom and meditation",
-            "Fire and transformation",
-            "Seasons changing",
-            "Inner peace and balance"
-        ]
-        
-        selected_example = st.selectbox("Or choose an example:", [""] + example_inspirations)
-        if selected_example:
-            user_inspiration = selected_example
+        # Inspiration and the generate button share a form, so nothing reruns until submit
+        with st.form("inspiration"):
+            # User input
+            user_inspiration = st.text_area(
+                "What inspires your mandala? (e.g., nature, emotions, experiences, dreams)",
+                placeholder="Enter your inspiration here... (e.g., 'sunset over mountains', 'feeling of peace and harmony', 'blooming lotus flower')",
+                height=100
+            )
+            
+            # Example inspirations
+            st.markdown("#### 💡 Need inspiration? Try these:")
+            example_inspirations = [
+                "Ocean waves and seashells",
+                "Mountain peaks and pine trees",
+                "Butterfly wings and flowers",
+                "Stars and cosmic energy",
+                "Ancient wisdom and meditation",
+                "Fire and transformation",
+                "Seasons changing",
+                "Inner peace and balance"
+            ]
+            
+            selected_example = st.selectbox("Or choose an example:", [""] + example_inspirations)
+            if selected_example:
+                user_inspiration = selected_example
+            
+            # Unchecked, Generate always asks DALL-E for a fresh design
+            reuse_cached = st.checkbox(
+                "♻️ Reuse my previous result for identical settings",
+                value=True,
+                help="Saves an API call when you regenerate with the same inputs; uncheck to get a new design"
+            )
+            
+            # Generate button
+            generate_clicked = st.form_submit_button("🎨 Generate Mandala", type="primary", use_container_width=True)
         
         st.markdown('</div>', unsafe_allow_html=True)
         
-        # Generate button
-        # Generate button
-        if st.button("🎨 Generate Mandala", type="primary", use_container_width=True):
+        if generate_clicked:
             if not api_key.strip():
                 st.error("❌ Please enter your OpenAI API Key")
                 st.info("""
@@ -232,33 +456,120 @@ def main():
                         # Store the prompt for display
                         st.session_state.current_prompt = prompt
                         
-                        # Generate the mandala
-                        image_url = generate_mandala(client, prompt)
+                        # Generate the mandala(s)
+                        if num_variants == 1:
+                            image_bytes = generate_mandala(client, prompt, quality, reuse_cached)
+                            images = [image_bytes] if image_bytes else []
+                            errors = []
+                        else:
+                            images, errors = generate_mandala_variants(api_key, prompt, num_variants, quality, reuse_cached)
                         
-                        if image_url:
-                            st.session_state.current_image_url = image_url
+                        if images:
+                            st.session_state.current_images = images
+                            # Kept so partial failures survive the rerun below
+                            st.session_state.current_errors = errors
                             st.session_state.current_inspiration = user_inspiration
                             st.session_state.current_num_axes = num_axes
+                            st.session_state.current_quality = quality
                             st.success("✨ Your mandala has been created!")
                             st.rerun()
+        
+        # Batch mode: submit many inspirations at once through the Batch API
+        with st.expander("📦 Batch Mode (lower cost, results within 24h)"):
+            batch_text = st.text_area(
+                "Batch inspirations (one per line):",
+                placeholder="Ocean waves and seashells\nStars and cosmic energy",
+                height=120
+            )
+            
+            if st.button("📤 Submit Batch", use_container_width=True):
+                inspirations = [line.strip() for line in batch_text.splitlines() if line.strip()]
+                if not api_key.strip():
+                    st.error("❌ Please enter your OpenAI API Key")
+                elif not inspirations:
+                    st.warning("Please enter at least one inspiration for the batch!")
+                else:
+                    client = initialize_openai(api_key)
+                    if client:
+                        batch = submit_batch(client, inspirations, style_preference, color_scheme, num_axes, quality)
+                        if batch:
+                            st.session_state.batch_id = batch.id
+                            st.session_state.batch_inspirations = inspirations
+                            st.session_state.batch_images = []
+                            st.session_state.batch_errors = []
+                            st.success(f"✨ Batch submitted ({len(inspirations)} mandalas)")
+            
+            if hasattr(st.session_state, 'batch_id'):
+                st.write(f"**Batch ID:** `{st.session_state.batch_id}`")
+                if st.button("🔄 Check Batch Status", use_container_width=True):
+                    client = initialize_openai(api_key)
+                    if client:
+                        try:
+                            batch, results, failures = fetch_batch_results(client, st.session_state.batch_id)
+                            counts = batch.request_counts
+                            if counts:
+                                st.info(f"Status: {batch.status} ({counts.completed}/{counts.total} completed, {counts.failed} failed)")
+                            else:
+                                st.info(f"Status: {batch.status}")
+                            
+                            inspirations = st.session_state.batch_inspirations
+                            st.session_state.batch_images = [
+                                (inspiration, results[f"mandala-{i}"])
+                                for i, inspiration in enumerate(inspirations)
+                                if f"mandala-{i}" in results
+                            ]
+                            
+                            # Job-level errors (e.g. a rejected input file) plus per-item failures
+                            batch_errors = []
+                            if batch.status in ("failed", "expired", "cancelled"):
+                                batch_errors.append(f"Batch {batch.status}")
+                            if batch.errors and batch.errors.data:
+                                for error in batch.errors.data:
+                                    location = f"Line {error.line}: " if error.line else ""
+                                    batch_errors.append(f"{location}{error.message or error.code}")
+                            batch_errors.extend(
+                                f"{inspiration}: {failures[f'mandala-{i}']}"
+                                for i, inspiration in enumerate(inspirations)
+                                if f"mandala-{i}" in failures
+                            )
+                            st.session_state.batch_errors = batch_errors
+                        except Exception as e:
+                            st.error(f"Error checking batch: {str(e)}")
     
     with col2:
         st.markdown("### 🖼️ Your Generated Mandala")
         
         # Display generated image
-        if hasattr(st.session_state, 'current_image_url'):
+        if hasattr(st.session_state, 'current_images'):
             try:
-                # Download and display image
-                image_bytes = download_image(st.session_state.current_image_url)
-                if image_bytes:
-                    image = Image.open(io.BytesIO(image_bytes))
-                    st.image(image, caption=f"Inspired by: {st.session_state.current_inspiration}", use_container_width=True)
+                # Display images from the bytes stored at generation time
+                images = st.session_state.current_images
+                if images:
+                    # Report variants that failed while the others succeeded
+                    errors = getattr(st.session_state, 'current_errors', [])
+                    if errors:
+                        st.warning(f"⚠️ {len(errors)} of {len(images) + len(errors)} variants failed to generate")
+                        for error in errors:
+                            st.error(error)
                     
-                    # Download button
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"mandala_{timestamp}.png"
-                    download_link = create_download_link(image_bytes, filename)
-                    st.markdown(download_link, unsafe_allow_html=True)
+                    image_cols = st.columns(min(len(images), 2))
+                    
+                    for i, image_bytes in enumerate(images):
+                        with image_cols[i % len(image_cols)]:
+                            # Downscaled PNG bytes are served by URL, cached across reruns
+                            st.image(make_preview(image_bytes), caption=f"Inspired by: {st.session_state.current_inspiration}", use_container_width=True)
+                            
+                            # Download button
+                            suffix = f"_{i + 1}" if len(images) > 1 else ""
+                            filename = f"mandala_{timestamp}{suffix}.png"
+                            st.download_button(
+                                label="📥 Download Mandala",
+                                data=image_bytes,
+                                file_name=filename,
+                                mime="image/png",
+                                key=f"download_{i}"
+                            )
                     
                     # Display generation details
                     with st.expander("🔍 Generation Details"):
@@ -267,6 +578,8 @@ def main():
                         st.write(f"**Color Scheme:** {color_scheme}")
                         if hasattr(st.session_state, 'current_num_axes'):
                             st.write(f"**Symmetry Axes:** {st.session_state.current_num_axes}-fold symmetry")
+                        if hasattr(st.session_state, 'current_quality'):
+                            st.write(f"**Quality:** {st.session_state.current_quality}")
                         st.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
                         
                         if hasattr(st.session_state, 'current_prompt'):
@@ -299,6 +612,26 @@ def main():
             - Sign up and navigate to API Keys
             - Create a new key and paste it above
             """)
+        
+        # Display completed batch results and any failures
+        batch_errors = getattr(st.session_state, 'batch_errors', None)
+        if getattr(st.session_state, 'batch_images', None) or batch_errors:
+            st.markdown("### 📦 Batch Results")
+            if batch_errors:
+                st.warning(f"⚠️ {len(batch_errors)} batch error(s)")
+                for error in batch_errors:
+                    st.error(error)
+            batch_cols = st.columns(2)
+            for i, (inspiration, image_bytes) in enumerate(st.session_state.batch_images):
+                with batch_cols[i % 2]:
+                    st.image(make_preview(image_bytes), caption=f"Inspired by: {inspiration}", use_container_width=True)
+                    st.download_button(
+                        label="📥 Download Mandala",
+                        data=image_bytes,
+                        file_name=f"mandala_batch_{i + 1}.png",
+                        mime="image/png",
+                        key=f"batch_download_{i}"
+                    )
     
     # Footer
     st.markdown("---")